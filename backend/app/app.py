@@ -1,73 +1,137 @@
-from flask import Flask, jsonify, request, Blueprint, abort
+from typing import Optional
+
+import orjson
+from flask import Flask, Response, request, Blueprint, abort, current_app
 from app.order_tracker import OrderTracker
 from app.in_memory_storage import InMemoryStorage
 
-app = Flask(__name__)
+# Fields required in the body of a create request
+CREATE_ORDER_FIELDS = frozenset(("order_id", "item_name", "quantity", "customer_id"))
 
-# Initialize the order tracker with in memory storage
-storage = InMemoryStorage()
-order_tracker = OrderTracker(storage=storage)
+# Number of orders encoded per chunk in streamed list responses
+STREAM_CHUNK_SIZE = 500
 
 # Create API blueprint with /api prefix
 api = Blueprint("api", __name__, url_prefix="/api")
 
 
+def raw_json_response(body, status=200):
+    """Wrap already encoded JSON bytes in a response."""
+    return Response(body, status=status, mimetype="application/json")
+
+
+def json_response(payload, status=200):
+    """Serialize payload with orjson and wrap it in a JSON response."""
+    return raw_json_response(orjson.dumps(payload), status)
+
+
+def orders_response(orders, fields=None, status=200):
+    """
+    Stream an {"orders": [...], "count": N, **fields} payload.
+
+    Orders are encoded STREAM_CHUNK_SIZE at a time, so the full response body
+    is never held in memory at once.
+    """
+
+    def generate():
+        yield b'{"orders":['
+        for start in range(0, len(orders), STREAM_CHUNK_SIZE):
+            # Encode the slice as a JSON array and strip its brackets
+            chunk = orjson.dumps(orders[start : start + STREAM_CHUNK_SIZE])[1:-1]
+            yield chunk if start == 0 else b"," + chunk
+        yield b"]," + orjson.dumps({"count": len(orders), **(fields or {})})[1:]
+
+    return Response(generate(), status=status, mimetype="application/json")
+
+
+# Static response bodies, encoded once at import time
+INDEX_BODY = orjson.dumps(
+    {
+        "message": "Welcome to the Order Tracker API!",
+        "endpoints": {
+            "create_order": "POST /api/create",
+            "create_orders_batch": "POST /api/create_batch",
+            "get_order": "GET /api/get/<order_id>",
+            "update_order_status": "PUT /api/update/<order_id>",
+            "get_all_orders": "GET /api/orders",
+            "get_orders_by_customer": "GET /api/orders?customer_id=<customer_id>",
+            "get_orders_by_status": "GET /api/orders/status/<status>",
+        },
+    }
+)
+ERROR_BODIES = {
+    400: orjson.dumps({"error": "Bad request"}),
+    404: orjson.dumps({"error": "Not found"}),
+    500: orjson.dumps({"error": "Internal server error"}),
+}
+
+
+def get_json_body():
+    """Decode the JSON request body with orjson, aborting with 400 if malformed."""
+    if not request.is_json:
+        abort(415)
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        abort(400)
+
+
+def get_order_tracker() -> OrderTracker:
+    """Return the order tracker bound to the current application."""
+    return current_app.extensions["order_tracker"]
+
+
 # Error handlers
-@app.errorhandler(400)
 def bad_request(error):
-    return jsonify({"error": "Bad request"}), 400
+    return raw_json_response(ERROR_BODIES[400], 400)
 
 
-@app.errorhandler(404)
 def not_found(error):
-    return jsonify({"error": "Not found"}), 404
+    return raw_json_response(ERROR_BODIES[404], 404)
 
 
-@app.errorhandler(500)
 def internal_error(error):
-    return jsonify({"error": "Internal server error"}), 500
+    return raw_json_response(ERROR_BODIES[500], 500)
 
 
-@app.route("/")
 def index():
-    return jsonify(
-        {
-            "message": "Welcome to the Order Tracker API!",
-            "endpoints": {
-                "create_order": "POST /api/create",
-                "get_order": "GET /api/get/<order_id>",
-                "update_order_status": "PUT /api/update/<order_id>",
-                "get_all_orders": "GET /api/orders",
-                "get_orders_by_customer": "GET /api/orders?customer_id=<customer_id>",
-                "get_orders_by_status": "GET /api/orders/status/<status>",
-            },
-        }
-    )
+    return raw_json_response(INDEX_BODY)
 
 
 @api.route("/create", methods=["POST"])
 def create_order():
     """Create a new order."""
-    data = request.get_json()
+    data = get_json_body()
 
-    if not data:
+    # Validate the payload shape in one check; field values are validated by
+    # the order tracker
+    if not isinstance(data, dict) or not data.keys() >= CREATE_ORDER_FIELDS:
         abort(400)
 
-    # Validate required fields
-    required_fields = ["order_id", "item_name", "quantity", "customer_id"]
-    for field in required_fields:
-        if field not in data:
-            abort(400)
-
     try:
         # Create the order
-        order = order_tracker.create_order(
+        order = get_order_tracker().create_order(
             order_id=data["order_id"],
             item_name=data["item_name"],
             quantity=data["quantity"],
             customer_id=data["customer_id"],
         )
-        return jsonify(order), 201
+        return json_response(order, 201)
+    except ValueError:
+        abort(400)
+
+
+@api.route("/create_batch", methods=["POST"])
+def create_orders_batch():
+    """Create several orders in one request."""
+    data = get_json_body()
+
+    if not isinstance(data, dict) or "orders" not in data:
+        abort(400)
+
+    try:
+        orders = get_order_tracker().create_orders_batch(data["orders"])
+        return orders_response(orders, status=201)
     except ValueError:
         abort(400)
 
@@ -76,10 +140,10 @@ def create_order():
 def get_order(order_id):
     """Get an order by ID."""
     try:
-        order = order_tracker.get_order(order_id)
+        order = get_order_tracker().get_order(order_id)
         if order is None:
             abort(404)
-        return jsonify(order), 200
+        return json_response(order)
     except ValueError:
         abort(400)
 
@@ -87,16 +151,16 @@ def get_order(order_id):
 @api.route("/update/<order_id>", methods=["PUT"])
 def update_order_status(order_id):
     """Update order status."""
-    data = request.get_json()
+    data = get_json_body()
 
     if not data or "status" not in data:
         abort(400)
 
     try:
-        order = order_tracker.update_order_status(order_id, data["status"])
+        order = get_order_tracker().update_order_status(order_id, data["status"])
         if order is None:
             abort(404)
-        return jsonify(order), 200
+        return json_response(order)
     except ValueError:
         abort(400)
 
@@ -106,38 +170,70 @@ def get_all_orders():
     """Get all orders, optionally filtered by customer_id."""
     # Check if customer_id filter is provided
     customer_id = request.args.get("customer_id")
+    order_tracker = get_order_tracker()
 
     if customer_id:
         try:
             # Filter by customer_id
             orders = order_tracker.get_orders_by_customer(customer_id)
-            return (
-                jsonify(
-                    {"orders": orders, "count": len(orders), "customer_id": customer_id}
-                ),
-                200,
-            )
         except ValueError:
             abort(400)
+
+        # Customers without orders get a plain body instead of a stream
+        if not orders:
+            return json_response({"orders": [], "count": 0, "customer_id": customer_id})
+        return orders_response(orders, {"customer_id": customer_id})
     else:
         # Return all orders
         orders = order_tracker.get_all_orders()
-        return jsonify({"orders": orders, "count": len(orders)}), 200
+        return orders_response(orders)
 
 
 @api.route("/orders/status/<status>", methods=["GET"])
 def get_orders_by_status(status):
     """Get orders by status."""
+    order_tracker = get_order_tracker()
+
     try:
         orders = order_tracker.get_orders_by_status(status)
-        return jsonify({"orders": orders, "count": len(orders), "status": status}), 200
     except ValueError:
         abort(400)
 
+    # Statuses no order currently has get a plain body instead of a stream
+    if not orders:
+        return json_response({"orders": [], "count": 0, "status": status})
+    return orders_response(orders, {"status": status})
+
+
+def create_app(storage: Optional[InMemoryStorage] = None) -> Flask:
+    """
+    Create and configure the Flask application.
+
+    Args:
+        storage: Storage backend for the app's order tracker. If None, creates a new InMemoryStorage.
+
+    Returns:
+        Flask: Application with its own order tracker, routes and error handlers
+    """
+    app = Flask(__name__)
+
+    # Initialize the order tracker with the given storage
+    app.extensions["order_tracker"] = OrderTracker(storage=storage)
+
+    app.register_error_handler(400, bad_request)
+    app.register_error_handler(404, not_found)
+    app.register_error_handler(500, internal_error)
+    app.add_url_rule("/", view_func=index)
+
+    # Register the API blueprint
+    app.register_blueprint(api)
+
+    return app
+
 
-# Register the API blueprint
-app.register_blueprint(api)
+app = create_app()
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Debug mode (reloader, debugger) is opt-in through FLASK_DEBUG.
+    app.run(host="0.0.0.0", port=5000)
@@ -1,3 +1,6 @@
+import threading
+from collections import defaultdict
+from datetime import datetime
 from typing import Optional, List
 from app.models import Order
 
@@ -8,6 +11,16 @@ class InMemoryStorage:
     def __init__(self):
         self.storage = {}
         self.orders = {}  # Specific storage for orders
+        # Secondary indexes: customer_id / status -> order_ids. The buckets are
+        # dicts with None values, used as insertion-ordered sets so filtered
+        # results come back in the order orders joined the bucket
+        self.by_customer = defaultdict(dict)
+        self.by_status = defaultdict(dict)
+        # order_id -> (customer_id, status) it is currently indexed under; kept
+        # apart from the Order because callers may mutate a stored Order in place
+        self._index_keys = {}
+        # Guards orders and its indexes against concurrent request threads
+        self._lock = threading.Lock()
 
     def get(self, key):
         return self.storage.get(key)
@@ -20,13 +33,85 @@ class InMemoryStorage:
             del self.storage[key]
 
     def clear(self):
-        self.storage.clear()
-        self.orders.clear()
+        with self._lock:
+            self.storage.clear()
+            self.orders.clear()
+            self.by_customer.clear()
+            self.by_status.clear()
+            self._index_keys.clear()
+
+    def _unindex(self, index: dict, key: str, order_id: str) -> None:
+        """Remove an order_id from an index bucket, dropping the bucket if empty."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(order_id, None)
+            if not bucket:
+                del index[key]
+
+    def _gather(self, order_ids) -> List[Order]:
+        """Fetch the orders for a bucket of IDs in one C-level pass."""
+        return list(map(self.orders.__getitem__, order_ids))
 
     # Order-specific methods
+    def _save(self, order: Order) -> None:
+        """Store an order and index it. The caller must hold the lock."""
+        self._drop_index_entries(order.order_id)
+        # The order may have been changed in place since its dict was cached
+        order.invalidate_cache()
+
+        self.orders[order.order_id] = order
+        self.by_customer[order.customer_id][order.order_id] = None
+        self.by_status[order.status][order.order_id] = None
+        self._index_keys[order.order_id] = (order.customer_id, order.status)
+
+    def _drop_index_entries(self, order_id: str) -> None:
+        """Remove an order_id from the buckets it was last indexed under."""
+        keys = self._index_keys.pop(order_id, None)
+        if keys is not None:
+            customer_id, status = keys
+            self._unindex(self.by_customer, customer_id, order_id)
+            self._unindex(self.by_status, status, order_id)
+
     def save_order(self, order: Order) -> None:
         """Save an order to storage."""
-        self.orders[order.order_id] = order
+        with self._lock:
+            self._save(order)
+
+    def insert_order(self, order: Order) -> bool:
+        """
+        Save an order only if its ID is not stored yet.
+
+        The check and the insert happen under one lock acquisition, so two
+        threads creating the same ID cannot both succeed. Returns True if the
+        order was inserted, False if the ID already exists.
+        """
+        with self._lock:
+            if order.order_id in self.orders:
+                return False
+            self._save(order)
+            return True
+
+    def save_orders(self, orders: List[Order]) -> None:
+        """Save several orders to storage under a single lock acquisition."""
+        with self._lock:
+            for order in orders:
+                self._save(order)
+
+    def insert_orders(self, orders: List[Order]) -> Optional[str]:
+        """
+        Save several orders only if none of their IDs is stored yet.
+
+        The checks and the inserts happen under one lock acquisition, so the
+        batch is stored whole or not at all. Returns None on success, or the
+        first order_id that already exists, in which case nothing is saved.
+        """
+        with self._lock:
+            for order in orders:
+                if order.order_id in self.orders:
+                    return order.order_id
+            for order in orders:
+                self._save(order)
+            return None
 
     def get_order(self, order_id: str) -> Optional[Order]:
         """Retrieve an order by ID."""
@@ -34,21 +119,44 @@ class InMemoryStorage:
 
     def get_all_orders(self) -> List[Order]:
         """Retrieve all orders."""
-        return list(self.orders.values())
+        with self._lock:
+            return list(self.orders.values())
+
+    def update_status(
+        self, order_id: str, new_status: str, updated_at: Optional[datetime] = None
+    ) -> Optional[Order]:
+        """
+        Update the status of a stored order, moving it between status buckets.
+
+        Returns the updated order, or None if no order has the given ID.
+        """
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None:
+                return None
+
+            customer_id, old_status = self._index_keys[order_id]
+            order.update_status(new_status, updated_at)
+            if old_status != order.status:
+                self._unindex(self.by_status, old_status, order_id)
+                self.by_status[order.status][order_id] = None
+                self._index_keys[order_id] = (customer_id, order.status)
+            return order
 
     def delete_order(self, order_id: str) -> bool:
         """Delete an order by ID. Returns True if deleted, False if not found."""
-        if order_id in self.orders:
-            del self.orders[order_id]
+        with self._lock:
+            if self.orders.pop(order_id, None) is None:
+                return False
+            self._drop_index_entries(order_id)
             return True
-        return False
 
     def get_orders_by_status(self, status: str) -> List[Order]:
         """Retrieve all orders with a specific status."""
-        return [order for order in self.orders.values() if order.status == status]
+        with self._lock:
+            return self._gather(self.by_status.get(status, ()))
 
     def get_orders_by_customer(self, customer_id: str) -> List[Order]:
         """Retrieve all orders for a specific customer."""
-        return [
-            order for order in self.orders.values() if order.customer_id == customer_id
-        ]
+        with self._lock:
+            return self._gather(self.by_customer.get(customer_id, ()))
@@ -1,9 +1,10 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Order model representing an order in the system.
@@ -25,40 +26,65 @@ class Order:
     status: str = "pending"
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Serialized form, built lazily by to_dict() and dropped when the order changes
+    _cached_dict: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize timestamps if not provided."""
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        # Statuses repeat across many orders; share one string object per value
+        if isinstance(self.status, str):
+            self.status = sys.intern(self.status)
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
 
-    def update_status(self, new_status: str) -> None:
+    def update_status(
+        self, new_status: str, updated_at: Optional[datetime] = None
+    ) -> None:
         """
         Update the order status and timestamp.
 
         Args:
             new_status (str): The new status for the order
+            updated_at (Optional[datetime]): Time of the update, defaults to now
         """
-        self.status = new_status
-        self.updated_at = datetime.now()
+        self.status = (
+            sys.intern(new_status) if isinstance(new_status, str) else new_status
+        )
+        self.updated_at = updated_at if updated_at is not None else datetime.now()
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached dictionary so the next to_dict() call rebuilds it."""
+        self._cached_dict = None
 
     def to_dict(self) -> dict:
         """
         Convert the order to a dictionary representation.
 
+        The dictionary is built once and cached until the order changes, so
+        callers must treat it as read-only. Timestamps are left as datetime
+        objects for the JSON encoder to format.
+
         Returns:
             dict: Dictionary representation of the order
         """
-        return {
-            "order_id": self.order_id,
-            "item_name": self.item_name,
-            "quantity": self.quantity,
-            "customer_id": self.customer_id,
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "order_id": self.order_id,
+                "item_name": self.item_name,
+                "quantity": self.quantity,
+                "customer_id": self.customer_id,
+                "status": self.status,
+                "created_at": self.created_at,
+                "updated_at": self.updated_at,
+            }
+        return self._cached_dict
 
     @classmethod
     def from_dict(cls, data: dict) -> "Order":
@@ -71,14 +97,14 @@ class Order:
         Returns:
             Order: New Order instance
         """
-        # Parse datetime strings if present
-        created_at = None
-        updated_at = None
-
-        if "created_at" in data and data["created_at"]:
-            created_at = datetime.fromisoformat(data["created_at"])
-        if "updated_at" in data and data["updated_at"]:
-            updated_at = datetime.fromisoformat(data["updated_at"])
+        # Parse datetime strings if present (to_dict() output holds datetimes)
+        created_at = data.get("created_at") or None
+        updated_at = data.get("updated_at") or None
+
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at)
 
         return cls(
             order_id=data["order_id"],
@@ -1,4 +1,5 @@
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Callable, Optional, Dict, Any, List
 from app.models import Order
 from app.in_memory_storage import InMemoryStorage
 
@@ -8,14 +9,20 @@ class OrderTracker:
     Core business logic for order tracking operations.
     """
 
-    def __init__(self, storage: Optional[InMemoryStorage] = None):
+    def __init__(
+        self,
+        storage: Optional[InMemoryStorage] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
         """
         Initialize the OrderTracker with a storage backend.
 
         Args:
             storage: Storage backend for persisting orders. If None, creates a new InMemoryStorage.
+            clock: Callable returning the current time for order timestamps. If None, uses datetime.now.
         """
         self.storage = storage if storage is not None else InMemoryStorage()
+        self.clock = clock if clock is not None else datetime.now
 
     def create_order(
         self, order_id: str, item_name: str, quantity: int, customer_id: str
@@ -36,36 +43,88 @@ class OrderTracker:
             ValueError: If order_id already exists or if any required field is invalid
         """
         # Validate input parameters
-        if not order_id or not isinstance(order_id, str):
-            raise ValueError("order_id is mandatory")
-
-        if not item_name or not isinstance(item_name, str):
-            raise ValueError("item_name is mandatory")
-
-        if not isinstance(quantity, int) or quantity <= 0:
-            raise ValueError("quantity is mandatory and must be bigger than 0")
-
-        if not customer_id or not isinstance(customer_id, str):
-            raise ValueError("customer_id is mandatory")
-
-        # Check if order with this ID already exists
-        if self.storage.get_order(order_id) is not None:
-            raise ValueError(f"Order with ID '{order_id}' already exists")
+        self._validate_order_fields(order_id, item_name, quantity, customer_id)
 
         # Create the order
+        now = self.clock()
         order = Order(
             order_id=order_id,
             item_name=item_name,
             quantity=quantity,
             customer_id=customer_id,
             status="pending",
+            created_at=now,
+            updated_at=now,
         )
 
-        # Store the order
-        self.storage.save_order(order)
+        # Store the order, unless another request already took its ID
+        if not self.storage.insert_order(order):
+            raise ValueError(f"Order with ID '{order_id}' already exists")
 
         # Return the order as a dictionary
-        return order.to_dict()
+        return self._as_dict(order)
+
+    def create_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several orders at once.
+
+        The whole batch is validated first and then inserted in one atomic
+        storage call, so either all orders are created or none is.
+
+        Args:
+            orders (List[Dict[str, Any]]): Order details, each with order_id,
+                item_name, quantity and customer_id
+
+        Returns:
+            List[Dict[str, Any]]: Dictionary representations of the created orders
+
+        Raises:
+            ValueError: If the batch is empty, any order is invalid, or an order_id
+                already exists or is repeated within the batch
+        """
+        # Validate the batch itself
+        if not orders or not isinstance(orders, list):
+            raise ValueError("orders is mandatory")
+
+        new_orders = []
+        batch_ids = set()
+        now = self.clock()  # One creation time for the whole batch
+        for data in orders:
+            if not isinstance(data, dict):
+                raise ValueError("orders must contain order objects")
+
+            order_id = data.get("order_id")
+            item_name = data.get("item_name")
+            quantity = data.get("quantity")
+            customer_id = data.get("customer_id")
+
+            # Validate input parameters
+            self._validate_order_fields(order_id, item_name, quantity, customer_id)
+
+            # IDs already in storage are checked when the batch is inserted
+            if order_id in batch_ids:
+                raise ValueError(f"Order with ID '{order_id}' already exists")
+            batch_ids.add(order_id)
+
+            new_orders.append(
+                Order(
+                    order_id=order_id,
+                    item_name=item_name,
+                    quantity=quantity,
+                    customer_id=customer_id,
+                    status="pending",
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+
+        # Store all orders in one storage call, unless any ID is already taken
+        existing_id = self.storage.insert_orders(new_orders)
+        if existing_id is not None:
+            raise ValueError(f"Order with ID '{existing_id}' already exists")
+
+        # Return the orders as dictionaries
+        return [self._as_dict(order) for order in new_orders]
 
     def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -88,7 +147,7 @@ class OrderTracker:
         order = self.storage.get_order(order_id)
 
         # Return as dictionary if found, None otherwise
-        return order.to_dict() if order else None
+        return self._as_dict(order) if order else None
 
     def update_order_status(
         self, order_id: str, new_status: str
@@ -113,21 +172,15 @@ class OrderTracker:
         if not new_status or not isinstance(new_status, str):
             raise ValueError("new_status is mandatory")
 
-        # Retrieve the order from storage
-        order = self.storage.get_order(order_id)
+        # Update the order in storage, keeping the status index in sync
+        order = self.storage.update_status(order_id, new_status, self.clock())
 
         # Return None if order doesn't exist
         if order is None:
             return None
 
-        # Update the order status using the Order's method
-        order.update_status(new_status)
-
-        # Save the updated order back to storage
-        self.storage.save_order(order)
-
         # Return the updated order as a dictionary
-        return order.to_dict()
+        return self._as_dict(order)
 
     def get_all_orders(self) -> List[Dict[str, Any]]:
         """
@@ -140,7 +193,7 @@ class OrderTracker:
         orders = self.storage.get_all_orders()
 
         # Convert all orders to dictionaries
-        return [order.to_dict() for order in orders]
+        return [self._as_dict(order) for order in orders]
 
     def get_orders_by_status(self, status: str) -> List[Dict[str, Any]]:
         """
@@ -163,7 +216,7 @@ class OrderTracker:
         orders = self.storage.get_orders_by_status(status)
 
         # Convert all orders to dictionaries
-        return [order.to_dict() for order in orders]
+        return [self._as_dict(order) for order in orders]
 
     def get_orders_by_customer(self, customer_id: str) -> List[Dict[str, Any]]:
         """
@@ -186,4 +239,46 @@ class OrderTracker:
         orders = self.storage.get_orders_by_customer(customer_id)
 
         # Convert all orders to dictionaries
-        return [order.to_dict() for order in orders]
+        return [self._as_dict(order) for order in orders]
+
+    @staticmethod
+    def _as_dict(order: Order) -> Dict[str, Any]:
+        """
+        Return a copy of the order's cached dictionary.
+
+        Callers own the copy and may edit it without touching the cache.
+        """
+        return order.to_dict().copy()
+
+    @staticmethod
+    def _validate_order_fields(
+        order_id: str, item_name: str, quantity: int, customer_id: str
+    ) -> None:
+        """
+        Validate the fields of a new order.
+
+        Raises:
+            ValueError: If any field is missing or invalid
+        """
+        # Valid input passes a single combined check, the field-by-field checks
+        # only run to report what is wrong
+        if not (
+            isinstance(order_id, str)
+            and order_id
+            and isinstance(item_name, str)
+            and item_name
+            and isinstance(quantity, int)
+            and quantity > 0
+            and isinstance(customer_id, str)
+            and customer_id
+        ):
+            if not order_id or not isinstance(order_id, str):
+                raise ValueError("order_id is mandatory")
+
+            if not item_name or not isinstance(item_name, str):
+                raise ValueError("item_name is mandatory")
+
+            if not isinstance(quantity, int) or quantity <= 0:
+                raise ValueError("quantity is mandatory and must be bigger than 0")
+
+            raise ValueError("customer_id is mandatory")
@@ -0,0 +1,14 @@
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests when SKIP_INTEGRATION is set in the environment."""
+    if not os.environ.get("SKIP_INTEGRATION"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="SKIP_INTEGRATION is set")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
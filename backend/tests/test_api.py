@@ -1,6 +1,13 @@
 import unittest
 import json
-from app.app import app
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.app import create_app
+
+pytestmark = pytest.mark.integration
 
 
 class TestAPIIntegration(unittest.TestCase):
@@ -8,12 +15,20 @@ class TestAPIIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test client and test data."""
-        self.app = app.test_client()
+        # Each test gets its own app and storage to avoid conflicts
+        self.app = create_app().test_client()
         self.app.testing = True
-        # Clear storage before each test to avoid conflicts
-        from app.app import storage
 
-        storage.clear()
+    def test_index(self):
+        """Test GET / returns 200 OK with the endpoint listing."""
+        response = self.app.get("/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/json")
+
+        response_data = json.loads(response.data)
+        self.assertIn("message", response_data)
+        self.assertEqual(response_data["endpoints"]["create_order"], "POST /api/create")
 
     def test_create_order_success(self):
         """Test POST /api/create with valid data returns 201 Created."""
@@ -52,6 +67,98 @@ class TestAPIIntegration(unittest.TestCase):
         self.assertEqual(response_data["customer_id"], order_data["customer_id"])
         self.assertEqual(response_data["status"], "pending")
 
+    def test_create_order_invalid_payload(self):
+        """Test POST /api/create with a malformed body returns 400 Bad Request."""
+        payloads = [
+            {"order_id": "ORDER001", "item_name": "Test Item", "quantity": 5},
+            ["order_id", "item_name", "quantity", "customer_id"],
+            {},
+        ]
+
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                response = self.app.post(
+                    "/api/create",
+                    data=json.dumps(payload),
+                    content_type="application/json",
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(json.loads(response.data)["error"], "Bad request")
+
+    def test_create_order_malformed_json(self):
+        """Test POST /api/create with a body that is not valid JSON returns 400."""
+        for body in ('{"order_id": "ORDER001",', ""):
+            with self.subTest(body=body):
+                response = self.app.post(
+                    "/api/create", data=body, content_type="application/json"
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(json.loads(response.data)["error"], "Bad request")
+
+    def test_create_orders_batch_success(self):
+        """Test POST /api/create_batch with valid orders returns 201 Created."""
+        batch_data = {
+            "orders": [
+                {
+                    "order_id": "ORDER011",
+                    "item_name": "Batch Item 1",
+                    "quantity": 1,
+                    "customer_id": "CUST011",
+                },
+                {
+                    "order_id": "ORDER012",
+                    "item_name": "Batch Item 2",
+                    "quantity": 4,
+                    "customer_id": "CUST011",
+                },
+            ]
+        }
+
+        response = self.app.post(
+            "/api/create_batch",
+            data=json.dumps(batch_data),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        response_data = json.loads(response.data)
+        self.assertEqual(response_data["count"], 2)
+        self.assertEqual(
+            [order["order_id"] for order in response_data["orders"]],
+            ["ORDER011", "ORDER012"],
+        )
+
+        # The orders are retrievable afterwards
+        get_response = self.app.get("/api/orders?customer_id=CUST011")
+        self.assertEqual(json.loads(get_response.data)["count"], 2)
+
+    def test_create_orders_batch_invalid(self):
+        """Test POST /api/create_batch with an invalid order creates nothing."""
+        batch_data = {
+            "orders": [
+                {
+                    "order_id": "ORDER013",
+                    "item_name": "Batch Item 3",
+                    "quantity": 1,
+                    "customer_id": "CUST013",
+                },
+                {
+                    "order_id": "ORDER014",
+                    "item_name": "Batch Item 4",
+                    "quantity": 0,
+                    "customer_id": "CUST013",
+                },
+            ]
+        }
+
+        response = self.app.post(
+            "/api/create_batch",
+            data=json.dumps(batch_data),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.app.get("/api/get/ORDER013").status_code, 404)
+
     def test_get_order_success(self):
         """Test GET /api/get/<order_id> with existing order returns 200 OK with correct data."""
         # First, create an order to fetch
@@ -96,6 +203,8 @@ class TestAPIIntegration(unittest.TestCase):
         # Assert timestamps are present and valid
         self.assertIsNotNone(response_data["created_at"])
         self.assertIsNotNone(response_data["updated_at"])
+        datetime.fromisoformat(response_data["created_at"])
+        datetime.fromisoformat(response_data["updated_at"])
 
     def test_get_order_not_found(self):
         """Test GET /api/get/<order_id> with non-existing order returns 404 Not Found."""
@@ -255,6 +364,33 @@ class TestAPIIntegration(unittest.TestCase):
             self.assertIn("created_at", order)
             self.assertIn("updated_at", order)
 
+    @patch("app.app.STREAM_CHUNK_SIZE", 2)
+    def test_get_all_orders_spanning_several_chunks(self):
+        """Test GET /api/orders returns valid JSON when streamed in several chunks."""
+        for i in range(5):
+            order_data = {
+                "order_id": f"ORDER10{i}",
+                "item_name": f"Chunked Item {i}",
+                "quantity": 1,
+                "customer_id": "CUST100",
+            }
+            create_response = self.app.post(
+                "/api/create",
+                data=json.dumps(order_data),
+                content_type="application/json",
+            )
+            self.assertEqual(create_response.status_code, 201)
+
+        get_response = self.app.get("/api/orders")
+        self.assertEqual(get_response.status_code, 200)
+
+        response_data = json.loads(get_response.data)
+        self.assertEqual(response_data["count"], 5)
+        self.assertEqual(
+            [order["order_id"] for order in response_data["orders"]],
+            [f"ORDER10{i}" for i in range(5)],
+        )
+
     def test_get_orders_by_customer_success(self):
         """Test GET /api/orders?customer_id=<customer_id> returns 200 OK with filtered orders."""
         # First, create orders for different customers
@@ -322,6 +458,64 @@ class TestAPIIntegration(unittest.TestCase):
             self.assertIn("created_at", order)
             self.assertIn("updated_at", order)
 
+    def test_get_orders_by_status_success(self):
+        """Test GET /api/orders/status/<status> returns 200 OK with filtered orders."""
+        for order_id in ("ORDER015", "ORDER016"):
+            order_data = {
+                "order_id": order_id,
+                "item_name": "Status Item",
+                "quantity": 1,
+                "customer_id": "CUST015",
+            }
+            create_response = self.app.post(
+                "/api/create",
+                data=json.dumps(order_data),
+                content_type="application/json",
+            )
+            self.assertEqual(create_response.status_code, 201)
+
+        update_response = self.app.put(
+            "/api/update/ORDER016",
+            data=json.dumps({"status": "shipped"}),
+            content_type="application/json",
+        )
+        self.assertEqual(update_response.status_code, 200)
+
+        get_response = self.app.get("/api/orders/status/shipped")
+        self.assertEqual(get_response.status_code, 200)
+
+        response_data = json.loads(get_response.data)
+        self.assertEqual(response_data["status"], "shipped")
+        self.assertEqual(response_data["count"], 1)
+        self.assertEqual(response_data["orders"][0]["order_id"], "ORDER016")
+
+    def test_get_orders_unknown_filters_return_empty(self):
+        """Test filtering by an unknown customer or status returns an empty list."""
+        order_data = {
+            "order_id": "ORDER010",
+            "item_name": "Test Item 10",
+            "quantity": 1,
+            "customer_id": "CUST010",
+        }
+        create_response = self.app.post(
+            "/api/create", data=json.dumps(order_data), content_type="application/json"
+        )
+        self.assertEqual(create_response.status_code, 201)
+
+        customer_response = self.app.get("/api/orders?customer_id=UNKNOWN")
+        self.assertEqual(customer_response.status_code, 200)
+        self.assertEqual(
+            json.loads(customer_response.data),
+            {"orders": [], "count": 0, "customer_id": "UNKNOWN"},
+        )
+
+        status_response = self.app.get("/api/orders/status/shipped")
+        self.assertEqual(status_response.status_code, 200)
+        self.assertEqual(
+            json.loads(status_response.data),
+            {"orders": [], "count": 0, "status": "shipped"},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,135 @@
+import threading
+
+import pytest
+
+from app.models import Order
+from app.in_memory_storage import InMemoryStorage
+
+pytestmark = pytest.mark.integration
+
+
+class TestInMemoryStorageIndexes:
+    """Unit tests for the customer and status indexes of InMemoryStorage."""
+
+    def setup_method(self):
+        """Set up a storage holding one pending order before each test method."""
+        self.storage = InMemoryStorage()
+        self.storage.save_order(Order("ORD001", "Laptop", 2, "CUST001", "pending"))
+
+    def test_resave_after_in_place_status_change(self):
+        """Test that re-saving a mutated stored order moves it between buckets."""
+        order = self.storage.get_order("ORD001")
+        order.update_status("shipped")
+        self.storage.save_order(order)
+
+        assert dict(self.storage.by_status) == {"shipped": {"ORD001": None}}
+        assert self.storage.get_orders_by_status("pending") == []
+        assert self.storage.get_orders_by_status("shipped") == [order]
+
+    def test_resave_with_changed_status_and_customer(self):
+        """Test that saving a new object for an existing ID re-indexes it."""
+        order = Order("ORD001", "Laptop", 2, "CUST002", "delivered")
+        self.storage.save_order(order)
+
+        assert dict(self.storage.by_status) == {"delivered": {"ORD001": None}}
+        assert dict(self.storage.by_customer) == {"CUST002": {"ORD001": None}}
+        assert self.storage.get_orders_by_customer("CUST001") == []
+
+    def test_resave_after_in_place_customer_change(self):
+        """Test that re-saving an order whose customer was changed re-indexes it."""
+        order = self.storage.get_order("ORD001")
+        order.customer_id = "CUST002"
+        self.storage.save_order(order)
+
+        assert dict(self.storage.by_customer) == {"CUST002": {"ORD001": None}}
+
+    def test_update_status_after_resave(self):
+        """Test that update_status moves the order out of its indexed bucket."""
+        self.storage.update_status("ORD001", "shipped")
+        self.storage.update_status("ORD001", "delivered")
+
+        assert dict(self.storage.by_status) == {"delivered": {"ORD001": None}}
+
+    def test_filters_return_orders_in_creation_order(self):
+        """Test that filtered orders keep the order they were saved in."""
+        order_ids = [f"ORD1{i:02d}" for i in range(12)]
+        for order_id in order_ids:
+            self.storage.save_order(Order(order_id, "Item", 1, "CUST002", "shipped"))
+
+        by_customer = self.storage.get_orders_by_customer("CUST002")
+        by_status = self.storage.get_orders_by_status("shipped")
+
+        assert [order.order_id for order in by_customer] == order_ids
+        assert [order.order_id for order in by_status] == order_ids
+
+    def test_insert_order_skips_existing_id(self):
+        """Test that insert_order refuses an ID that is already stored."""
+        duplicate = Order("ORD001", "Mouse", 1, "CUST002", "shipped")
+
+        assert self.storage.insert_order(duplicate) is False
+        assert self.storage.get_order("ORD001").item_name == "Laptop"
+        assert dict(self.storage.by_customer) == {"CUST001": {"ORD001": None}}
+
+        assert self.storage.insert_order(Order("ORD002", "Mouse", 1, "CUST002"))
+        assert self.storage.get_order("ORD002").item_name == "Mouse"
+
+    def test_insert_order_concurrent_same_id(self):
+        """Test that only one of several threads inserting one ID succeeds."""
+        barrier = threading.Barrier(8)
+        results = []
+
+        def insert(n):
+            barrier.wait()
+            results.append(
+                self.storage.insert_order(Order("ORD002", f"Item{n}", 1, "C"))
+            )
+
+        threads = [threading.Thread(target=insert, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 1
+        assert len(self.storage.get_all_orders()) == 2
+
+    def test_insert_orders_is_all_or_nothing(self):
+        """Test that insert_orders stores nothing if any ID already exists."""
+        batch = [
+            Order("ORD002", "Mouse", 1, "CUST002"),
+            Order("ORD001", "Keyboard", 1, "CUST002"),
+        ]
+
+        assert self.storage.insert_orders(batch) == "ORD001"
+        assert self.storage.get_order("ORD002") is None
+        assert self.storage.get_order("ORD001").item_name == "Laptop"
+
+        assert self.storage.insert_orders(batch[:1]) is None
+        assert self.storage.get_orders_by_customer("CUST002") == batch[:1]
+
+    def test_delete_order_prunes_both_indexes(self):
+        """Test that deleting the only order of a bucket removes the bucket."""
+        self.storage.save_order(Order("ORD002", "Mouse", 1, "CUST001", "shipped"))
+
+        assert self.storage.delete_order("ORD001") is True
+        assert dict(self.storage.by_customer) == {"CUST001": {"ORD002": None}}
+        assert dict(self.storage.by_status) == {"shipped": {"ORD002": None}}
+
+        assert self.storage.delete_order("ORD002") is True
+        assert dict(self.storage.by_customer) == {}
+        assert dict(self.storage.by_status) == {}
+
+        assert self.storage.delete_order("ORD002") is False
+
+    def test_clear_empties_orders_and_indexes(self):
+        """Test that clear() removes every order and index entry."""
+        self.storage.clear()
+
+        assert self.storage.get_all_orders() == []
+        assert dict(self.storage.by_customer) == {}
+        assert dict(self.storage.by_status) == {}
+
+        # A cleared ID can be saved again without stale index entries
+        self.storage.save_order(Order("ORD001", "Laptop", 2, "CUST003", "shipped"))
+        assert dict(self.storage.by_customer) == {"CUST003": {"ORD001": None}}
+        assert dict(self.storage.by_status) == {"shipped": {"ORD001": None}}
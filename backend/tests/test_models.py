@@ -0,0 +1,47 @@
+from app.models import Order
+
+
+class TestOrderStatus:
+    """Unit tests for how Order stores its status."""
+
+    def test_equal_statuses_share_one_string(self):
+        """Test that orders with the same status share one interned string."""
+        status = "".join(["ship", "ped"])
+        first = Order("ORD001", "Laptop", 2, "CUST001", status)
+        second = Order("ORD002", "Mouse", 1, "CUST002", "pending")
+        second.update_status("".join(["ship", "ped"]))
+
+        assert first.status is second.status
+
+    def test_non_string_status_is_kept_as_is(self):
+        """Test that a non-string status is stored without interning."""
+        order = Order.from_dict(
+            {
+                "order_id": "ORD001",
+                "item_name": "Laptop",
+                "quantity": 2,
+                "customer_id": "CUST001",
+                "status": None,
+            }
+        )
+        assert order.status is None
+
+        order.update_status(None)
+        assert order.status is None
+
+
+class TestOrderToDict:
+    """Unit tests for the cached dictionary form of Order."""
+
+    def test_update_status_rebuilds_the_cached_dict(self):
+        """Test that a status update also picks up fields changed in place."""
+        order = Order("ORD001", "Laptop", 2, "CUST001", "pending")
+        first = order.to_dict()
+
+        order.quantity = 5
+        order.update_status("shipped")
+        second = order.to_dict()
+
+        assert second["quantity"] == 5
+        assert second["status"] == "shipped"
+        assert first["status"] == "pending"  # Earlier dict left unchanged
@@ -1,159 +1,317 @@
-import unittest
-from unittest.mock import Mock, patch
+import copy
+from unittest.mock import ANY, create_autospec
 from datetime import datetime
 
+import pytest
+
 from app.order_tracker import OrderTracker
 from app.models import Order
 from app.in_memory_storage import InMemoryStorage
 
-
-class TestOrderTrackerCreateOrder(unittest.TestCase):
+# Built once per module: introspecting InMemoryStorage is the costly part of
+# autospeccing, so every test reuses this mock and resets it in setup_method
+_STORAGE_SPEC = create_autospec(InMemoryStorage, instance=True, spec_set=True)
+
+
+def reset_storage_mock(*method_names):
+    """Reset only the named methods of the shared storage mock and return it."""
+    for name in method_names:
+        getattr(_STORAGE_SPEC, name).reset_mock(return_value=True, side_effect=True)
+    return _STORAGE_SPEC
+
+
+# Values rejected by every "<field> is mandatory" string check
+BAD_STRING_INPUTS = ("", None, 123, [], {}, True)
+
+BAD_QUANTITY_INPUTS = (0, -1, "2", 2.5, None)
+
+BAD_BATCH_CASES = (
+    ([], "orders is mandatory"),
+    (None, "orders is mandatory"),
+    ({"order_id": "ORD001"}, "orders is mandatory"),
+    (["ORD001"], "orders must contain order objects"),
+    (
+        [
+            {
+                "order_id": "ORD001",
+                "item_name": "Laptop",
+                "quantity": 2,
+                "customer_id": "CUST001",
+            },
+            {
+                "order_id": "ORD002",
+                "item_name": "Mouse",
+                "quantity": 0,
+                "customer_id": "CUST002",
+            },
+        ],
+        "quantity is mandatory and must be bigger than 0",
+    ),
+    (
+        [{"order_id": "ORD003", "item_name": "Monitor", "quantity": 1}],
+        "customer_id is mandatory",
+    ),
+)
+
+COMMON_STATUSES = (
+    "pending",
+    "confirmed",
+    "processing",
+    "shipped",
+    "delivered",
+    "cancelled",
+    "returned",
+    "refunded",
+)
+
+SEED_ORDERS = (
+    ("ORD001", "Laptop", 2, "CUST001"),
+    ("ORD002", "Mouse", 1, "CUST002"),
+    ("ORD003", "Keyboard", 1, "CUST001"),
+)
+
+# Timestamp for sample orders, so building them never calls datetime.now()
+FIXED_TIME = datetime(2025, 1, 1)
+
+
+def make_order(*args, **kwargs):
+    """Build a sample Order stamped with FIXED_TIME."""
+    return Order(*args, created_at=FIXED_TIME, updated_at=FIXED_TIME, **kwargs)
+
+
+def order_dict(order_id, item_name, quantity, customer_id, status="pending"):
+    """Expected to_dict() output for an order built with make_order()."""
+    return {
+        "order_id": order_id,
+        "item_name": item_name,
+        "quantity": quantity,
+        "customer_id": customer_id,
+        "status": status,
+        "created_at": FIXED_TIME,
+        "updated_at": FIXED_TIME,
+    }
+
+
+# Sample orders for the status filter tests, grouped the way storage would
+# return them for each status
+ORDERS_BY_STATUS = {
+    "pending": (
+        make_order("ORD001", "Laptop", 2, "CUST001", "pending"),
+        make_order("ORD005", "Headset", 1, "CUST002", "pending"),
+    ),
+    "shipped": (
+        make_order("ORD002", "Mouse", 1, "CUST002", "shipped"),
+        make_order("ORD003", "Keyboard", 1, "CUST001", "shipped"),
+    ),
+    "delivered": (make_order("ORD004", "Monitor", 1, "CUST003", "delivered"),),
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_tracker():
+    """Tracker on real storage holding SEED_ORDERS, shared by read-only tests."""
+    tracker = OrderTracker(storage=InMemoryStorage(), clock=lambda: FIXED_TIME)
+    for order_args in SEED_ORDERS:
+        tracker.create_order(*order_args)
+    return tracker
+
+
+@pytest.fixture
+def fresh_seeded_tracker(seeded_tracker):
+    """Tracker on its own storage holding copies of the seeded orders."""
+    storage = InMemoryStorage()
+    storage.save_orders(
+        [copy.copy(order) for order in seeded_tracker.storage.get_all_orders()]
+    )
+    return OrderTracker(storage=storage)
+
+
+class FakeStorage:
+    """Hand-written stand-in for InMemoryStorage that records calls in lists."""
+
+    def __init__(self, existing_order=None):
+        self.existing_order = existing_order
+        self.insert_calls = []
+        self.saved = []
+
+    def insert_order(self, order):
+        self.insert_calls.append(order.order_id)
+        if self.existing_order is not None:
+            return False
+        self.saved.append(order)
+        return True
+
+
+class TestOrderTrackerCreateOrder:
     """Unit tests for the OrderTracker.create_order method."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_storage = Mock(spec=InMemoryStorage)
-        self.order_tracker = OrderTracker(storage=self.mock_storage)
-
-        self.valid_order_data = {
+    @classmethod
+    def setup_class(cls):
+        """Set up fixtures shared by all test methods."""
+        cls.valid_order_data = {
             "order_id": "ORD001",
             "item_name": "Laptop",
             "quantity": 2,
             "customer_id": "CUST001",
         }
 
+    def setup_method(self):
+        """Set up a fresh fake storage before each test method."""
+        self.fake_storage = FakeStorage()
+        self.order_tracker = OrderTracker(storage=self.fake_storage)
+
     def test_create_order_success(self):
         """Test successful order creation with valid data."""
-        self.mock_storage.get_order.return_value = None
         self.order_tracker.create_order(**self.valid_order_data)
-        self.mock_storage.get_order.assert_called_once_with("ORD001")
-        self.mock_storage.save_order.assert_called_once()
+        assert self.fake_storage.insert_calls == ["ORD001"]
+        assert len(self.fake_storage.saved) == 1
 
-        saved_order = self.mock_storage.save_order.call_args[0][0]
-        self.assertIsInstance(saved_order, Order)
-        self.assertEqual(saved_order.order_id, "ORD001")
+        saved_order = self.fake_storage.saved[0]
+        assert isinstance(saved_order, Order)
+        assert saved_order.order_id == "ORD001"
+        assert saved_order.created_at == saved_order.updated_at
 
     def test_create_order_duplicate_id(self):
         """Test that creating an order with duplicate ID raises ValueError."""
-        existing_order = Order("ORD001", "Item", 1, "CUST001")
-        self.mock_storage.get_order.return_value = existing_order
+        self.fake_storage.existing_order = make_order("ORD001", "Item", 1, "CUST001")
 
-        with self.assertRaises(ValueError) as context:
+        with pytest.raises(ValueError) as context:
             self.order_tracker.create_order(**self.valid_order_data)
 
-        self.assertIn("Order with ID 'ORD001' already exists", str(context.exception))
-
-        self.mock_storage.save_order.assert_not_called()
+        assert "Order with ID 'ORD001' already exists" in str(context.value)
 
-    def test_create_order_invalid_order_id(self):
-        """Test validation of order_id parameter."""
-        test_cases = [
-            ("", "order_id is mandatory"),
-            (None, "order_id is mandatory"),
-            (123, "order_id is mandatory"),
-            ([], "order_id is mandatory"),
-        ]
+        assert self.fake_storage.saved == []
 
-        for invalid_order_id, expected_message in test_cases:
-            with self.subTest(order_id=invalid_order_id):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.create_order(
-                        order_id=invalid_order_id,
-                        item_name="Laptop",
-                        quantity=2,
-                        customer_id="CUST001",
-                    )
-                self.assertEqual(str(context.exception), expected_message)
-
-    def test_create_order_invalid_item_name(self):
-        """Test validation of item_name parameter."""
-        test_cases = [
-            ("", "item_name is mandatory"),
-            (None, "item_name is mandatory"),
-            (123, "item_name is mandatory"),
-            ([], "item_name is mandatory"),
-        ]
+    @pytest.mark.parametrize("field", ("order_id", "item_name", "customer_id"))
+    @pytest.mark.parametrize("invalid_value", BAD_STRING_INPUTS)
+    def test_create_order_invalid_string_field(self, field, invalid_value):
+        """Test validation of the order_id, item_name and customer_id parameters."""
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.create_order(
+                **{**self.valid_order_data, field: invalid_value}
+            )
+        assert str(context.value) == f"{field} is mandatory"
 
-        for invalid_item_name, expected_message in test_cases:
-            with self.subTest(item_name=invalid_item_name):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.create_order(
-                        order_id="ORD001",
-                        item_name=invalid_item_name,
-                        quantity=2,
-                        customer_id="CUST001",
-                    )
-                self.assertEqual(str(context.exception), expected_message)
-
-    def test_create_order_invalid_quantity(self):
+    @pytest.mark.parametrize("invalid_quantity", BAD_QUANTITY_INPUTS)
+    def test_create_order_invalid_quantity(self, invalid_quantity):
         """Test validation of quantity parameter."""
-        test_cases = [
-            (0, "quantity is mandatory and must be bigger than 0"),
-            (-1, "quantity is mandatory and must be bigger than 0"),
-            ("2", "quantity is mandatory and must be bigger than 0"),
-            (2.5, "quantity is mandatory and must be bigger than 0"),
-            (None, "quantity is mandatory and must be bigger than 0"),
-        ]
-
-        for invalid_quantity, expected_message in test_cases:
-            with self.subTest(quantity=invalid_quantity):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.create_order(
-                        order_id="ORD001",
-                        item_name="Laptop",
-                        quantity=invalid_quantity,
-                        customer_id="CUST001",
-                    )
-                self.assertEqual(str(context.exception), expected_message)
-
-    def test_create_order_invalid_customer_id(self):
-        """Test validation of customer_id parameter."""
-        test_cases = [
-            ("", "customer_id is mandatory"),
-            (None, "customer_id is mandatory"),
-            (123, "customer_id is mandatory"),
-            ([], "customer_id is mandatory"),
-        ]
-
-        for invalid_customer_id, expected_message in test_cases:
-            with self.subTest(customer_id=invalid_customer_id):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.create_order(
-                        order_id="ORD001",
-                        item_name="Laptop",
-                        quantity=2,
-                        customer_id=invalid_customer_id,
-                    )
-                self.assertEqual(str(context.exception), expected_message)
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.create_order(
+                order_id="ORD001",
+                item_name="Laptop",
+                quantity=invalid_quantity,
+                customer_id="CUST001",
+            )
+        assert str(context.value) == "quantity is mandatory and must be bigger than 0"
 
     def test_create_order_with_default_storage(self):
         """Test OrderTracker initialization with default storage."""
         tracker = OrderTracker()
-        self.assertIsInstance(tracker.storage, InMemoryStorage)
+        assert isinstance(tracker.storage, InMemoryStorage)
 
-    @patch("app.models.datetime")
-    def test_create_order_timestamps(self, mock_datetime):
+    def test_create_order_timestamps(self):
         """Test that created_at and updated_at timestamps are set correctly."""
         mock_now = datetime(2025, 7, 31, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+        tracker = OrderTracker(storage=self.fake_storage, clock=lambda: mock_now)
+
+        tracker.create_order(**self.valid_order_data)
+
+        saved_order = self.fake_storage.saved[0]
+        assert saved_order.created_at == mock_now
+        assert saved_order.updated_at == mock_now
+
+
+class TestOrderTrackerCreateOrdersBatch:
+    """Unit tests for the OrderTracker.create_orders_batch method."""
+
+    @classmethod
+    def setup_class(cls):
+        """Set up fixtures shared by all test methods."""
+        cls.valid_batch = [
+            {
+                "order_id": "ORD001",
+                "item_name": "Laptop",
+                "quantity": 2,
+                "customer_id": "CUST001",
+            },
+            {
+                "order_id": "ORD002",
+                "item_name": "Mouse",
+                "quantity": 1,
+                "customer_id": "CUST002",
+            },
+        ]
 
-        self.mock_storage.get_order.return_value = None
-        self.order_tracker.create_order(**self.valid_order_data)
+    def setup_method(self):
+        """Reset the shared storage mock before each test method."""
+        self.mock_storage = reset_storage_mock(
+            "get_order", "save_order", "save_orders", "insert_orders"
+        )
+        self.order_tracker = OrderTracker(storage=self.mock_storage)
 
-        saved_order = self.mock_storage.save_order.call_args[0][0]
-        self.assertEqual(saved_order.created_at, mock_now)
-        self.assertEqual(saved_order.updated_at, mock_now)
+        # Most tests create orders whose IDs are not stored yet
+        self.mock_storage.insert_orders.return_value = None
 
+    def test_create_orders_batch_success(self):
+        """Test successful creation of a batch of valid orders."""
+        result = self.order_tracker.create_orders_batch(self.valid_batch)
+        self.mock_storage.insert_orders.assert_called_once()
+        self.mock_storage.get_order.assert_not_called()
+        self.mock_storage.save_order.assert_not_called()
 
-class TestOrderTrackerGetOrder(unittest.TestCase):
-    """Unit tests for the OrderTracker.get_order method."""
+        saved_orders = self.mock_storage.insert_orders.call_args[0][0]
+        assert [order.order_id for order in saved_orders] == ["ORD001", "ORD002"]
+        assert [order["order_id"] for order in result] == ["ORD001", "ORD002"]
+        assert all(order["status"] == "pending" for order in result)
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_storage = Mock(spec=InMemoryStorage)
-        self.order_tracker = OrderTracker(storage=self.mock_storage)
+    def test_create_orders_batch_existing_id(self):
+        """Test that a batch containing an existing order ID stores nothing."""
+        self.mock_storage.insert_orders.return_value = "ORD002"
 
-        self.sample_order = Order(
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.create_orders_batch(self.valid_batch)
+
+        assert "Order with ID 'ORD002' already exists" in str(context.value)
+        self.mock_storage.save_orders.assert_not_called()
+
+    def test_create_orders_batch_repeated_id(self):
+        """Test that an order ID repeated within the batch stores nothing."""
+        batch = [self.valid_batch[0], dict(self.valid_batch[1], order_id="ORD001")]
+
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.create_orders_batch(batch)
+
+        assert "Order with ID 'ORD001' already exists" in str(context.value)
+        self.mock_storage.insert_orders.assert_not_called()
+
+    @pytest.mark.parametrize("invalid_batch, expected_message", BAD_BATCH_CASES)
+    def test_create_orders_batch_invalid_input(self, invalid_batch, expected_message):
+        """Test validation of the batch and of each order in it."""
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.create_orders_batch(invalid_batch)
+        assert str(context.value) == expected_message
+        self.mock_storage.insert_orders.assert_not_called()
+
+    @pytest.mark.integration
+    def test_create_orders_batch_storage_integration(self):
+        """Test create_orders_batch with real InMemoryStorage (integration test)."""
+        real_storage = InMemoryStorage()
+        tracker = OrderTracker(storage=real_storage)
+
+        tracker.create_orders_batch(self.valid_batch)
+
+        assert tracker.get_order("ORD001")["item_name"] == "Laptop"
+        assert len(tracker.get_orders_by_status("pending")) == 2
+        assert len(tracker.get_orders_by_customer("CUST002")) == 1
+
+
+class TestOrderTrackerGetOrder:
+    """Unit tests for the OrderTracker.get_order method."""
+
+    @classmethod
+    def setup_class(cls):
+        """Set up fixtures shared by all test methods."""
+        cls.sample_order = make_order(
             order_id="ORD001",
             item_name="Laptop",
             quantity=2,
@@ -161,75 +319,70 @@ class TestOrderTrackerGetOrder(unittest.TestCase):
             status="pending",
         )
 
+    def setup_method(self):
+        """Reset the shared storage mock before each test method."""
+        self.mock_storage = reset_storage_mock("get_order")
+        self.order_tracker = OrderTracker(storage=self.mock_storage)
+
+        # Most tests look up the sample order
+        self.mock_storage.get_order.return_value = self.sample_order
+
     def test_get_order_success(self):
         """Test successful order retrieval with valid order_id."""
-        self.mock_storage.get_order.return_value = self.sample_order
         result = self.order_tracker.get_order("ORD001")
         self.mock_storage.get_order.assert_called_once_with("ORD001")
-        self.assertIsInstance(result, dict)
-        self.assertEqual(result["order_id"], "ORD001")
+        assert isinstance(result, dict)
+        assert result["order_id"] == "ORD001"
 
     def test_get_order_not_found(self):
         """Test order retrieval when order doesn't exist."""
         self.mock_storage.get_order.return_value = None
         result = self.order_tracker.get_order("NONEXISTENT")
         self.mock_storage.get_order.assert_called_once_with("NONEXISTENT")
-        self.assertIsNone(result)
+        assert result is None
 
-    def test_get_order_invalid_order_id(self):
+    @pytest.mark.parametrize("invalid_order_id", BAD_STRING_INPUTS)
+    def test_get_order_invalid_order_id(self, invalid_order_id):
         """Test validation of order_id parameter."""
-        test_cases = [
-            ("", "order_id is mandatory"),
-            (None, "order_id is mandatory"),
-            (123, "order_id is mandatory"),
-            ([], "order_id is mandatory"),
-            ({}, "order_id is mandatory"),
-            (True, "order_id is mandatory"),
-        ]
-
-        for invalid_order_id, expected_message in test_cases:
-            with self.subTest(order_id=invalid_order_id):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.get_order(invalid_order_id)
-                self.assertEqual(str(context.exception), expected_message)
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.get_order(invalid_order_id)
+        assert str(context.value) == "order_id is mandatory"
 
-                self.mock_storage.get_order.assert_not_called()
-                self.mock_storage.reset_mock()
+        self.mock_storage.get_order.assert_not_called()
 
-    def test_get_order_with_different_statuses(self):
+    @pytest.mark.parametrize("status", ("pending", "shipped", "delivered", "cancelled"))
+    def test_get_order_with_different_statuses(self, status):
         """Test retrieving orders with different statuses."""
-        statuses = ["pending", "shipped", "delivered", "cancelled"]
+        order = make_order("ORD001", "Item", 1, "CUST001", status)
+        self.mock_storage.get_order.return_value = order
+        result = self.order_tracker.get_order("ORD001")
+        assert result["status"] == status
 
-        for status in statuses:
-            with self.subTest(status=status):
-                order = Order("ORD001", "Item", 1, "CUST001", status)
-                self.mock_storage.get_order.return_value = order
-                result = self.order_tracker.get_order("ORD001")
-                self.assertEqual(result["status"], status)
-                self.mock_storage.reset_mock()
+    def test_get_order_result_is_a_copy(self):
+        """Test that editing a returned order does not affect later reads."""
+        result = self.order_tracker.get_order("ORD001")
+        result["status"] = "hacked"
+
+        assert self.order_tracker.get_order("ORD001")["status"] == "pending"
 
-    def test_get_order_storage_integration(self):
+    @pytest.mark.integration
+    def test_get_order_storage_integration(self, seeded_tracker):
         """Test get_order with real InMemoryStorage (integration test)."""
-        real_storage = InMemoryStorage()
-        tracker = OrderTracker(storage=real_storage)
-        created_order = tracker.create_order("ORD001", "Laptop", 2, "CUST001")
-        retrieved_order = tracker.get_order("ORD001")
-        self.assertEqual(created_order["order_id"], retrieved_order["order_id"])
-        self.assertEqual(created_order["item_name"], retrieved_order["item_name"])
+        retrieved_order = seeded_tracker.get_order("ORD001")
+        assert retrieved_order["order_id"] == "ORD001"
+        assert retrieved_order["item_name"] == "Laptop"
 
-        non_existent = tracker.get_order("NONEXISTENT")
-        self.assertIsNone(non_existent)
+        non_existent = seeded_tracker.get_order("NONEXISTENT")
+        assert non_existent is None
 
 
-class TestOrderTrackerUpdateOrderStatus(unittest.TestCase):
+class TestOrderTrackerUpdateOrderStatus:
     """Unit tests for the OrderTracker.update_order_status method."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_storage = Mock(spec=InMemoryStorage)
-        self.order_tracker = OrderTracker(storage=self.mock_storage)
-
-        self.sample_order = Order(
+    @classmethod
+    def setup_class(cls):
+        """Set up fixtures shared by all test methods."""
+        cls.sample_order = make_order(
             order_id="ORD001",
             item_name="Laptop",
             quantity=2,
@@ -237,344 +390,285 @@ class TestOrderTrackerUpdateOrderStatus(unittest.TestCase):
             status="pending",
         )
 
+    def setup_method(self):
+        """Reset the shared storage mock before each test method."""
+        self.mock_storage = reset_storage_mock("update_status", "save_order")
+        self.order_tracker = OrderTracker(storage=self.mock_storage)
+
+        # Tests in this class mutate the order, so each one gets its own copy
+        self.sample_order = copy.copy(self.sample_order)
+
+        # Most tests update the sample order
+        self.mock_storage.update_status.side_effect = self._apply_status_update
+
+    def _apply_status_update(self, order_id, new_status, updated_at=None):
+        """Mimic InMemoryStorage.update_status on the sample order."""
+        self.sample_order.update_status(new_status, updated_at)
+        return self.sample_order
+
     def test_update_order_status_success(self):
         """Test successful order status update with valid data."""
-        self.mock_storage.get_order.return_value = self.sample_order
         result = self.order_tracker.update_order_status("ORD001", "shipped")
-        self.mock_storage.get_order.assert_called_once_with("ORD001")
-        self.mock_storage.save_order.assert_called_once()
+        self.mock_storage.update_status.assert_called_once_with(
+            "ORD001", "shipped", ANY
+        )
+        self.mock_storage.save_order.assert_not_called()
 
-        saved_order = self.mock_storage.save_order.call_args[0][0]
-        self.assertEqual(saved_order.status, "shipped")
+        assert self.sample_order.status == "shipped"
 
-        self.assertIsInstance(result, dict)
-        self.assertEqual(result["order_id"], "ORD001")
+        assert isinstance(result, dict)
+        assert result["order_id"] == "ORD001"
 
     def test_update_order_status_order_not_found(self):
         """Test updating status when order doesn't exist."""
-        self.mock_storage.get_order.return_value = None
+        self.mock_storage.update_status.side_effect = None
+        self.mock_storage.update_status.return_value = None
         result = self.order_tracker.update_order_status("NONEXISTENT", "shipped")
-        self.mock_storage.get_order.assert_called_once_with("NONEXISTENT")
+        self.mock_storage.update_status.assert_called_once_with(
+            "NONEXISTENT", "shipped", ANY
+        )
         self.mock_storage.save_order.assert_not_called()
 
-        self.assertIsNone(result)
+        assert result is None
 
-    def test_update_order_status_invalid_order_id(self):
-        """Test validation of order_id parameter."""
-        test_cases = [
-            ("", "order_id is mandatory"),
-            (None, "order_id is mandatory"),
-            (123, "order_id is mandatory"),
-            ([], "order_id is mandatory"),
-            ({}, "order_id is mandatory"),
-            (True, "order_id is mandatory"),
-        ]
-
-        for invalid_order_id, expected_message in test_cases:
-            with self.subTest(order_id=invalid_order_id):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.update_order_status(invalid_order_id, "shipped")
-                self.assertEqual(str(context.exception), expected_message)
-                self.mock_storage.get_order.assert_not_called()
-                self.mock_storage.save_order.assert_not_called()
-                self.mock_storage.reset_mock()
-
-    def test_update_order_status_invalid_new_status(self):
-        """Test validation of new_status parameter."""
-        test_cases = [
-            ("", "new_status is mandatory"),
-            (None, "new_status is mandatory"),
-            (123, "new_status is mandatory"),
-            ([], "new_status is mandatory"),
-            ({}, "new_status is mandatory"),
-            (True, "new_status is mandatory"),
-        ]
+    @pytest.mark.parametrize("field", ("order_id", "new_status"))
+    @pytest.mark.parametrize("invalid_value", BAD_STRING_INPUTS)
+    def test_update_order_status_invalid_input(self, field, invalid_value):
+        """Test validation of the order_id and new_status parameters."""
+        kwargs = {"order_id": "ORD001", "new_status": "shipped", field: invalid_value}
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.update_order_status(**kwargs)
+        assert str(context.value) == f"{field} is mandatory"
+        self.mock_storage.update_status.assert_not_called()
 
-        for invalid_status, expected_message in test_cases:
-            with self.subTest(new_status=invalid_status):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.update_order_status("ORD001", invalid_status)
-                self.assertEqual(str(context.exception), expected_message)
-                self.mock_storage.get_order.assert_not_called()
-                self.mock_storage.save_order.assert_not_called()
-                self.mock_storage.reset_mock()
-
-    @patch("app.models.datetime")
-    def test_update_order_status_updates_timestamp(self, mock_datetime):
+    def test_update_order_status_updates_timestamp(self):
         """Test that updating status also updates the updated_at timestamp."""
         original_time = datetime(2025, 7, 31, 10, 0, 0)
         updated_time = datetime(2025, 7, 31, 12, 0, 0)
-        mock_datetime.now.return_value = updated_time
+        tracker = OrderTracker(storage=self.mock_storage, clock=lambda: updated_time)
 
         self.sample_order.created_at = original_time
         self.sample_order.updated_at = original_time
-        self.mock_storage.get_order.return_value = self.sample_order
 
-        self.order_tracker.update_order_status("ORD001", "shipped")
+        tracker.update_order_status("ORD001", "shipped")
+        self.mock_storage.update_status.assert_called_once_with(
+            "ORD001", "shipped", updated_time
+        )
 
-        saved_order = self.mock_storage.save_order.call_args[0][0]
-        self.assertEqual(
-            saved_order.created_at, original_time
-        )  # Should remain unchanged
-        self.assertEqual(saved_order.updated_at, updated_time)  # Should be updated
+        assert self.sample_order.created_at == original_time  # Should remain unchanged
+        assert self.sample_order.updated_at == updated_time  # Should be updated
 
-    def test_update_order_status_storage_integration(self):
+    @pytest.mark.integration
+    def test_update_order_status_storage_integration(self, fresh_seeded_tracker):
         """Test update_order_status with real InMemoryStorage (integration test)."""
-        real_storage = InMemoryStorage()
-        tracker = OrderTracker(storage=real_storage)
+        tracker = fresh_seeded_tracker
 
-        created_order = tracker.create_order("ORD001", "Laptop", 2, "CUST001")
-        self.assertEqual(created_order["status"], "pending")
+        created_order = tracker.get_order("ORD001")
+        assert created_order["status"] == "pending"
 
         updated_order = tracker.update_order_status("ORD001", "shipped")
-        self.assertEqual(updated_order["status"], "shipped")
+        assert updated_order["status"] == "shipped"
+        assert created_order["status"] == "pending"  # Earlier snapshot
 
         retrieved_order = tracker.get_order("ORD001")
-        self.assertEqual(retrieved_order["status"], "shipped")
+        assert retrieved_order["status"] == "shipped"
 
         non_existent_update = tracker.update_order_status("NONEXISTENT", "shipped")
-        self.assertIsNone(non_existent_update)
+        assert non_existent_update is None
 
-    def test_update_order_status_common_statuses(self):
-        """Test updating to common order statuses."""
-        common_statuses = [
-            "pending",
-            "confirmed",
-            "processing",
-            "shipped",
-            "delivered",
-            "cancelled",
-            "returned",
-            "refunded",
-        ]
+    @pytest.mark.integration
+    def test_in_place_change_and_resave(self, fresh_seeded_tracker):
+        """Test that tracker output follows an order changed in place and re-saved."""
+        tracker = fresh_seeded_tracker
+        tracker.get_order("ORD001")  # Populate the cached dict
 
-        for status in common_statuses:
-            with self.subTest(status=status):
-                self.sample_order.status = "pending"
-                self.mock_storage.get_order.return_value = self.sample_order
-                result = self.order_tracker.update_order_status("ORD001", status)
-                self.assertEqual(result["status"], status)
-                self.mock_storage.reset_mock()
+        order = tracker.storage.get_order("ORD001")
+        order.status = "shipped"
+        tracker.storage.save_order(order)
 
+        assert tracker.get_order("ORD001")["status"] == "shipped"
+        shipped_orders = tracker.get_orders_by_status("shipped")
+        assert [o["order_id"] for o in shipped_orders] == ["ORD001"]
+        assert shipped_orders[0]["status"] == "shipped"
+
+    @pytest.mark.integration
+    def test_update_order_status_moves_status_index(self):
+        """Test that a status update moves the order between status buckets."""
+        real_storage = InMemoryStorage()
+        tracker = OrderTracker(storage=real_storage)
+        tracker.create_order("ORD001", "Laptop", 2, "CUST001")
+
+        tracker.update_order_status("ORD001", "shipped")
+        assert dict(real_storage.by_status) == {"shipped": {"ORD001": None}}
 
-class TestOrderTrackerGetAllOrders(unittest.TestCase):
+        tracker.update_order_status("ORD001", "shipped")
+        assert dict(real_storage.by_status) == {"shipped": {"ORD001": None}}
+        assert dict(real_storage.by_customer) == {"CUST001": {"ORD001": None}}
+
+    @pytest.mark.parametrize("status", COMMON_STATUSES)
+    def test_update_order_status_common_statuses(self, status):
+        """Test updating to common order statuses."""
+        result = self.order_tracker.update_order_status("ORD001", status)
+        assert result["status"] == status
+
+
+class TestOrderTrackerGetAllOrders:
     """Unit tests for the OrderTracker.get_all_orders method."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_storage = Mock(spec=InMemoryStorage)
+    @classmethod
+    def setup_class(cls):
+        """Set up fixtures shared by all test methods."""
+        cls.sample_orders = [
+            make_order("ORD001", "Laptop", 2, "CUST001", "pending"),
+            make_order("ORD002", "Mouse", 1, "CUST002", "shipped"),
+            make_order("ORD003", "Keyboard", 1, "CUST001", "delivered"),
+        ]
+
+    def setup_method(self):
+        """Reset the shared storage mock before each test method."""
+        self.mock_storage = reset_storage_mock("get_all_orders")
         self.order_tracker = OrderTracker(storage=self.mock_storage)
 
-        self.sample_orders = [
-            Order("ORD001", "Laptop", 2, "CUST001", "pending"),
-            Order("ORD002", "Mouse", 1, "CUST002", "shipped"),
-            Order("ORD003", "Keyboard", 1, "CUST001", "delivered"),
-        ]
+        # Default listing, replaced by the tests that need other orders
+        self.mock_storage.get_all_orders.return_value = self.sample_orders
 
     def test_get_all_orders_success(self):
         """Test successful retrieval of all orders."""
-        self.mock_storage.get_all_orders.return_value = self.sample_orders
         result = self.order_tracker.get_all_orders()
         self.mock_storage.get_all_orders.assert_called_once()
 
-        self.assertIsInstance(result, list)
-        self.assertEqual(len(result), 3)
-
-        self.assertEqual(result[0]["order_id"], "ORD001")
-        self.assertEqual(result[1]["order_id"], "ORD002")
-        self.assertEqual(result[2]["order_id"], "ORD003")
-
-        for order_dict in result:
-            self.assertIn("created_at", order_dict)
-            self.assertIn("updated_at", order_dict)
+        assert result == [
+            order_dict("ORD001", "Laptop", 2, "CUST001", "pending"),
+            order_dict("ORD002", "Mouse", 1, "CUST002", "shipped"),
+            order_dict("ORD003", "Keyboard", 1, "CUST001", "delivered"),
+        ]
 
     def test_get_all_orders_empty_storage(self):
         """Test get_all_orders when no orders exist."""
         self.mock_storage.get_all_orders.return_value = []
         result = self.order_tracker.get_all_orders()
         self.mock_storage.get_all_orders.assert_called_once()
-        self.assertIsInstance(result, list)
-        self.assertEqual(len(result), 0)
+        assert isinstance(result, list)
+        assert len(result) == 0
 
     def test_get_all_orders_single_order(self):
         """Test get_all_orders with only one order."""
-        single_order = [Order("ORD001", "Laptop", 1, "CUST001", "pending")]
+        single_order = [make_order("ORD001", "Laptop", 1, "CUST001", "pending")]
         self.mock_storage.get_all_orders.return_value = single_order
         result = self.order_tracker.get_all_orders()
 
-        self.assertIsInstance(result, list)
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0]["order_id"], "ORD001")
-        self.assertEqual(result[0]["status"], "pending")
+        assert result == [order_dict("ORD001", "Laptop", 1, "CUST001", "pending")]
 
     def test_get_all_orders_preserves_order_sequence(self):
         """Test that get_all_orders preserves the order sequence from storage."""
         ordered_orders = [
-            Order("ORD003", "Item C", 1, "CUST003", "pending"),
-            Order("ORD001", "Item A", 1, "CUST001", "shipped"),
-            Order("ORD002", "Item B", 1, "CUST002", "delivered"),
+            make_order("ORD003", "Item C", 1, "CUST003", "pending"),
+            make_order("ORD001", "Item A", 1, "CUST001", "shipped"),
+            make_order("ORD002", "Item B", 1, "CUST002", "delivered"),
         ]
         self.mock_storage.get_all_orders.return_value = ordered_orders
 
         result = self.order_tracker.get_all_orders()
 
-        self.assertEqual(result[0]["order_id"], "ORD003")
-        self.assertEqual(result[1]["order_id"], "ORD001")
-        self.assertEqual(result[2]["order_id"], "ORD002")
+        assert result[0]["order_id"] == "ORD003"
+        assert result[1]["order_id"] == "ORD001"
+        assert result[2]["order_id"] == "ORD002"
 
-    def test_get_all_orders_storage_integration(self):
+    @pytest.mark.integration
+    def test_get_all_orders_storage_integration(self, seeded_tracker):
         """Test get_all_orders with real InMemoryStorage (integration test)."""
-        real_storage = InMemoryStorage()
-        tracker = OrderTracker(storage=real_storage)
+        tracker = OrderTracker(storage=InMemoryStorage())
 
         result = tracker.get_all_orders()
-        self.assertEqual(len(result), 0)
+        assert len(result) == 0
 
-        tracker.create_order("ORD001", "Laptop", 2, "CUST001")
-        tracker.create_order("ORD002", "Mouse", 1, "CUST002")
-        tracker.create_order("ORD003", "Keyboard", 1, "CUST001")
+        all_orders = seeded_tracker.get_all_orders()
 
-        all_orders = tracker.get_all_orders()
-
-        self.assertEqual(len(all_orders), 3)
+        assert len(all_orders) == 3
         order_ids = [order["order_id"] for order in all_orders]
-        self.assertIn("ORD001", order_ids)
-        self.assertIn("ORD002", order_ids)
-        self.assertIn("ORD003", order_ids)
+        assert "ORD001" in order_ids
+        assert "ORD002" in order_ids
+        assert "ORD003" in order_ids
 
 
-class TestOrderTrackerGetOrdersByStatus(unittest.TestCase):
+class TestOrderTrackerGetOrdersByStatus:
     """Unit tests for the OrderTracker.get_orders_by_status method."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_storage = Mock(spec=InMemoryStorage)
+    def setup_method(self):
+        """Reset the shared storage mock before each test method."""
+        self.mock_storage = reset_storage_mock("get_orders_by_status")
         self.order_tracker = OrderTracker(storage=self.mock_storage)
 
-        self.sample_orders = [
-            Order("ORD001", "Laptop", 2, "CUST001", "pending"),
-            Order("ORD002", "Mouse", 1, "CUST002", "shipped"),
-            Order("ORD003", "Keyboard", 1, "CUST001", "shipped"),
-            Order("ORD004", "Monitor", 1, "CUST003", "delivered"),
-            Order("ORD005", "Headset", 1, "CUST002", "pending"),
-        ]
-
     def test_get_orders_by_status_success_shipped(self):
         """Test successful retrieval of orders with 'shipped' status."""
-        shipped_orders = [
-            order for order in self.sample_orders if order.status == "shipped"
-        ]
-        self.mock_storage.get_orders_by_status.return_value = shipped_orders
+        self.mock_storage.get_orders_by_status.return_value = list(
+            ORDERS_BY_STATUS["shipped"]
+        )
         result = self.order_tracker.get_orders_by_status("shipped")
         self.mock_storage.get_orders_by_status.assert_called_once_with("shipped")
-        self.assertIsInstance(result, list)
-        self.assertEqual(len(result), 2)
-
-        for order_dict in result:
-            self.assertEqual(order_dict["status"], "shipped")
-
-        order_ids = [order["order_id"] for order in result]
-        self.assertIn("ORD002", order_ids)
-        self.assertIn("ORD003", order_ids)
+        assert result == [
+            order_dict("ORD002", "Mouse", 1, "CUST002", "shipped"),
+            order_dict("ORD003", "Keyboard", 1, "CUST001", "shipped"),
+        ]
 
     def test_get_orders_by_status_success_pending(self):
         """Test successful retrieval of orders with 'pending' status."""
-        pending_orders = [
-            order for order in self.sample_orders if order.status == "pending"
-        ]
-        self.mock_storage.get_orders_by_status.return_value = pending_orders
+        self.mock_storage.get_orders_by_status.return_value = list(
+            ORDERS_BY_STATUS["pending"]
+        )
 
         result = self.order_tracker.get_orders_by_status("pending")
         self.mock_storage.get_orders_by_status.assert_called_once_with("pending")
-        self.assertIsInstance(result, list)
-        self.assertEqual(len(result), 2)
-
-        for order_dict in result:
-            self.assertEqual(order_dict["status"], "pending")
-
-        order_ids = [order["order_id"] for order in result]
-        self.assertIn("ORD001", order_ids)
-        self.assertIn("ORD005", order_ids)
+        assert result == [
+            order_dict("ORD001", "Laptop", 2, "CUST001", "pending"),
+            order_dict("ORD005", "Headset", 1, "CUST002", "pending"),
+        ]
 
     def test_get_orders_by_status_no_matches(self):
         """Test get_orders_by_status when no orders match the status."""
         self.mock_storage.get_orders_by_status.return_value = []
         result = self.order_tracker.get_orders_by_status("cancelled")
         self.mock_storage.get_orders_by_status.assert_called_once_with("cancelled")
-        self.assertIsInstance(result, list)
-        self.assertEqual(len(result), 0)
+        assert isinstance(result, list)
+        assert len(result) == 0
 
-    def test_get_orders_by_status_invalid_status(self):
+    @pytest.mark.parametrize("invalid_status", BAD_STRING_INPUTS)
+    def test_get_orders_by_status_invalid_status(self, invalid_status):
         """Test validation of status parameter."""
-        test_cases = [
-            ("", "status is mandatory"),
-            (None, "status is mandatory"),
-            (123, "status is mandatory"),
-            ([], "status is mandatory"),
-            ({}, "status is mandatory"),
-            (True, "status is mandatory"),
-        ]
-
-        for invalid_status, expected_message in test_cases:
-            with self.subTest(status=invalid_status):
-                with self.assertRaises(ValueError) as context:
-                    self.order_tracker.get_orders_by_status(invalid_status)
-                self.assertEqual(str(context.exception), expected_message)
-                self.mock_storage.get_orders_by_status.assert_not_called()
-                self.mock_storage.reset_mock()
+        with pytest.raises(ValueError) as context:
+            self.order_tracker.get_orders_by_status(invalid_status)
+        assert str(context.value) == "status is mandatory"
+        self.mock_storage.get_orders_by_status.assert_not_called()
 
-    def test_get_orders_by_status_common_statuses(self):
+    @pytest.mark.parametrize("status", COMMON_STATUSES)
+    def test_get_orders_by_status_common_statuses(self, status):
         """Test filtering by common order statuses."""
-        common_statuses = [
-            "pending",
-            "confirmed",
-            "processing",
-            "shipped",
-            "delivered",
-            "cancelled",
-            "returned",
-            "refunded",
+        filtered_orders = [
+            make_order(f"ORD{i}", f"Item{i}", 1, f"CUST{i}", status) for i in range(2)
+        ]
+        self.mock_storage.get_orders_by_status.return_value = filtered_orders
+        result = self.order_tracker.get_orders_by_status(status)
+        assert result == [
+            order_dict(f"ORD{i}", f"Item{i}", 1, f"CUST{i}", status) for i in range(2)
         ]
 
-        for status in common_statuses:
-            with self.subTest(status=status):
-                filtered_orders = [
-                    Order(f"ORD{i}", f"Item{i}", 1, f"CUST{i}", status)
-                    for i in range(2)
-                ]
-                self.mock_storage.get_orders_by_status.return_value = filtered_orders
-                result = self.order_tracker.get_orders_by_status(status)
-                self.assertEqual(len(result), 2)
-                for order_dict in result:
-                    self.assertEqual(order_dict["status"], status)
-
-                self.mock_storage.reset_mock()
-
-    def test_get_orders_by_status_storage_integration(self):
+    @pytest.mark.integration
+    def test_get_orders_by_status_storage_integration(self, fresh_seeded_tracker):
         """Test get_orders_by_status with real InMemoryStorage (integration test)."""
-        real_storage = InMemoryStorage()
-        tracker = OrderTracker(storage=real_storage)
-
-        tracker.create_order("ORD001", "Laptop", 2, "CUST001")
-        tracker.create_order("ORD002", "Mouse", 1, "CUST002")
-        tracker.create_order("ORD003", "Keyboard", 1, "CUST001")
+        tracker = fresh_seeded_tracker
 
         tracker.update_order_status("ORD001", "shipped")
         tracker.update_order_status("ORD003", "shipped")
 
         pending_orders = tracker.get_orders_by_status("pending")
-        self.assertEqual(len(pending_orders), 1)
-        self.assertEqual(pending_orders[0]["order_id"], "ORD002")
+        assert len(pending_orders) == 1
+        assert pending_orders[0]["order_id"] == "ORD002"
 
         shipped_orders = tracker.get_orders_by_status("shipped")
-        self.assertEqual(len(shipped_orders), 2)
+        assert len(shipped_orders) == 2
         shipped_ids = [order["order_id"] for order in shipped_orders]
-        self.assertIn("ORD001", shipped_ids)
-        self.assertIn("ORD003", shipped_ids)
+        assert "ORD001" in shipped_ids
+        assert "ORD003" in shipped_ids
 
         delivered_orders = tracker.get_orders_by_status("delivered")
-        self.assertEqual(len(delivered_orders), 0)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert len(delivered_orders) == 0
@@ -0,0 +1,4 @@
+# WSGI entry point for production servers, e.g.:
+#   gunicorn --workers 1 --threads 8 --bind 0.0.0.0:5000 wsgi:app
+# Orders live in process memory, so run a single worker and scale with threads.
+from app.app import app  # noqa: F401